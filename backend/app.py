@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -26,6 +28,12 @@ app = FastAPI(
 )
 settings = get_settings()
 
+# Service modules log through module loggers; emit them at the configured level
+logging.basicConfig(
+    level=settings.LOG_LEVEL.upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
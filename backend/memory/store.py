@@ -1,7 +1,8 @@
 from typing import Optional, Dict, Any, List
 import json
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Session, create_engine, select
+from sqlalchemy import inspect
+from sqlmodel import SQLModel, Field, Session, create_engine, delete, func, select
 
 from settings import get_settings
 
@@ -103,7 +104,11 @@ class Avatar(SQLModel, table=True):
 
 
 def create_db(engine):
-    SQLModel.metadata.create_all(engine)
+    # one reflection query instead of create_all's per-table existence checks
+    existing = set(inspect(engine).get_table_names())
+    missing = [t for t in SQLModel.metadata.sorted_tables if t.name not in existing]
+    if missing:
+        SQLModel.metadata.create_all(engine, tables=missing, checkfirst=False)
 
 
 def upsert_agent(agent: Agent):
@@ -161,13 +166,9 @@ def upsert_flow_graph(flow_id: str, nodes: List[Dict[str, Any]], edges: List[Dic
         flow = s.get(Flow, flow_id)
         if not flow:
             return False
-        # delete existing using SQLModel/SQLAlchemy 2.x syntax
-        existing_nodes = s.exec(select(FlowNode).where(FlowNode.flow_id == flow_id)).all()
-        for node in existing_nodes:
-            s.delete(node)
-        existing_edges = s.exec(select(FlowEdge).where(FlowEdge.flow_id == flow_id)).all()
-        for edge in existing_edges:
-            s.delete(edge)
+        # delete existing with one bulk DELETE per table; nothing is loaded, so skip session sync
+        s.exec(delete(FlowNode).where(FlowNode.flow_id == flow_id).execution_options(synchronize_session=False))
+        s.exec(delete(FlowEdge).where(FlowEdge.flow_id == flow_id).execution_options(synchronize_session=False))
         
         # add new
         for n in nodes:
@@ -211,9 +212,9 @@ def list_flow_nodes_edges(flow_id: str) -> Dict[str, Any]:
 
 def save_flow_version(flow_id: str, graph: Dict[str, Any]) -> int:
     with Session(_engine) as s:
-        # compute next version
-        existing = s.exec(select(FlowVersion).where(FlowVersion.flow_id == flow_id)).all()
-        next_ver = (max([v.version for v in existing]) + 1) if existing else 1
+        # compute next version with a scalar MAX instead of loading every version row
+        latest = s.exec(select(func.max(FlowVersion.version)).where(FlowVersion.flow_id == flow_id)).one()
+        next_ver = (latest or 0) + 1
         fv = FlowVersion(id=f"{flow_id}-v{next_ver}", flow_id=flow_id, version=next_ver, graph_json=json.dumps(graph))
         s.add(fv)
         s.commit()
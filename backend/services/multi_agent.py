@@ -198,7 +198,7 @@ class MultiAgentCoordinator:
         
         else:
             # Default to first agent
-            return list(self.agents.keys())[0] if self.agents else None
+            return next(iter(self.agents), None)
     
     def _select_round_robin(self) -> Optional[str]:
         """Round-robin agent selection"""
@@ -226,7 +226,7 @@ class MultiAgentCoordinator:
                 if not agent["connections"]["incoming"]:
                     return agent_id
             # Fallback to first agent
-            return list(self.agents.keys())[0] if self.agents else None
+            return next(iter(self.agents), None)
         
         # Move to next agent in sequence
         current_agent = self.agents.get(self.current_agent_id)
@@ -283,11 +283,11 @@ class MultiAgentCoordinator:
                 return selected_agent_id
         
         # Fallback to current or first agent
-        return self.current_agent_id or list(self.agents.keys())[0]
+        return self.current_agent_id or next(iter(self.agents))
     
     def _select_priority(self) -> Optional[str]:
         """Priority-based agent selection (use first agent in list)"""
-        return list(self.agents.keys())[0] if self.agents else None
+        return next(iter(self.agents), None)
     
     async def _process_with_agent(
         self, 
@@ -1,14 +1,21 @@
 """Tavus Phoenix API client for real-time avatar streaming."""
+import logging
+
 import httpx
 from typing import Dict, Any, Optional
 from settings import get_settings
 
 
+logger = logging.getLogger(__name__)
+
+
 class TavusClient:
     """Wrapper for Tavus Phoenix API."""
     
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.settings = get_settings()
+        # Optional transport for the per-call AsyncClient (e.g. httpx.MockTransport in tests)
+        self.transport = transport
         # Derive and normalize base URL with readable steps
         base_url_setting = getattr(self.settings, "TAVUS_BASE_URL", "https://tavusapi.com/v2")
         base_url_value = base_url_setting or "https://tavusapi.com/v2"
@@ -33,7 +40,7 @@ class TavusClient:
             Dict with session_id, video_stream_url, and status
         """
         if not self.api_key or self.api_key == "your_tavus_api_key_here":
-            print("WARNING: TAVUS_API_KEY not configured")
+            logger.warning("[Tavus] TAVUS_API_KEY not configured")
             return {
                 "error": "TAVUS_API_KEY not configured",
                 "session_id": None,
@@ -49,9 +56,9 @@ class TavusClient:
                 "enable_vision": enable_vision
             }
 
-            print(f"[Tavus] Starting Phoenix session with replica_id={replica_id}, audio_url={audio_stream_url}")
+            logger.info("[Tavus] Starting Phoenix session with replica_id=%s, audio_url=%s", replica_id, audio_stream_url)
 
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=self.transport) as client:
                 response = await client.post(
                     f"{self.base_url}/phoenix",
                     headers={
@@ -64,7 +71,7 @@ class TavusClient:
 
                 if response.status_code not in (200, 201):
                     error_detail = response.text
-                    print(f"[Tavus] API error {response.status_code}: {error_detail}")
+                    logger.error("[Tavus] API error %s: %s", response.status_code, error_detail)
                     return {
                         "error": f"Tavus API error: {response.status_code}",
                         "session_id": None,
@@ -76,7 +83,7 @@ class TavusClient:
                 video_url = data.get("video_stream_url")
                 session_id = data.get("session_id")
 
-                print(f"[Tavus] Phoenix session started: session_id={session_id}, video_url={video_url}")
+                logger.info("[Tavus] Phoenix session started: session_id=%s, video_url=%s", session_id, video_url)
 
                 return {
                     "error": None,
@@ -85,14 +92,14 @@ class TavusClient:
                     "status": data.get("status", "started")
                 }
         except httpx.TimeoutException as e:
-            print(f"[Tavus] Timeout error: {str(e)}")
+            logger.error("[Tavus] Timeout error: %s", e)
             return {
                 "error": f"Tavus API timeout: {str(e)}",
                 "session_id": None,
                 "video_stream_url": None
             }
         except Exception as e:
-            print(f"[Tavus] Unexpected error: {str(e)}")
+            logger.error("[Tavus] Unexpected error: %s", e)
             return {
                 "error": f"Failed to start Tavus session: {str(e)}",
                 "session_id": None,
@@ -113,7 +120,7 @@ class TavusClient:
             return {"error": "TAVUS_API_KEY not configured", "status": "failed"}
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=self.transport) as client:
                 response = await client.post(
                     f"{self.base_url}/phoenix/{session_id}/stop",
                     headers={"x-api-key": self.api_key},
@@ -141,7 +148,7 @@ class TavusClient:
             return {"error": "TAVUS_API_KEY not configured", "replicas": []}
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=self.transport) as client:
                 response = await client.get(
                     f"{self.base_url}/replicas",
                     headers={"x-api-key": self.api_key},
@@ -184,7 +191,7 @@ class TavusClient:
             return {"error": "TAVUS_API_KEY not configured", "replica_id": None}
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=self.transport) as client:
                 response = await client.post(
                     f"{self.base_url}/replicas",
                     headers={
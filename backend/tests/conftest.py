@@ -1,28 +1,64 @@
 """Pytest configuration and fixtures for backend tests."""
 import pytest
+import re
+import respx
+from contextlib import contextmanager
+from types import SimpleNamespace
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Response
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 from unittest.mock import patch
-import tempfile
-import os
 
 from app import app
+from memory import store
 from memory.store import get_engine
 from settings import Settings, get_settings
 
 
-@pytest.fixture(name="test_db_engine")
-def test_db_engine_fixture():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine(
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Run unit tests before integration tests so ``-x`` fails fast.
+
+    Wraps pytest-randomly's shuffle; the sort is stable, so the random order
+    within each tier is kept.
+    """
+    result = yield
+    items.sort(key=lambda item: "integration" in item.path.parts)
+    return result
+
+
+def _memory_engine():
+    """Build an in-memory SQLite engine shared across threads."""
+    return create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+
+@pytest.fixture(name="store_engine", scope="session")
+def store_engine_fixture():
+    """In-memory SQLite database created and seeded with default templates once per session."""
+    engine = _memory_engine()
     SQLModel.metadata.create_all(engine)
+    with patch("memory.store._engine", engine):
+        store.seed_default_templates()
     yield engine
-    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(name="test_db_engine")
+def test_db_engine_fixture(store_engine):
+    """Connection to the session database inside a transaction rolled back after the test.
+
+    Sessions bound to the connection join that transaction, so their commits
+    never reach the shared database and each test starts from the seeded state.
+    """
+    with store_engine.connect() as connection:
+        transaction = connection.begin()
+        yield connection
+        transaction.rollback()
 
 
 @pytest.fixture(name="test_session")
@@ -32,8 +68,19 @@ def test_session_fixture(test_db_engine):
         yield session
 
 
-@pytest.fixture(name="mock_settings")
-def mock_settings_fixture():
+@pytest.fixture(name="database_url", scope="session")
+def database_url_fixture(worker_id, tmp_path_factory):
+    """Throwaway SQLite database file, one per pytest-xdist worker.
+
+    A file (rather than a single shared in-memory connection) lets concurrent
+    requests each use their own pooled connection.
+    """
+    path = tmp_path_factory.mktemp("db") / f"flowone_{worker_id}.db"
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture(name="mock_settings", scope="session")
+def mock_settings_fixture(database_url):
     """Mock settings with test values."""
     return Settings(
         GEMINI_API_KEY="test_gemini_key",
@@ -41,41 +88,193 @@ def mock_settings_fixture():
         LANGFUSE_PUBLIC_KEY="",
         LANGFUSE_SECRET_KEY="",
         LANGFUSE_HOST="https://cloud.langfuse.com",
-        DATABASE_URL="sqlite:///:memory:",
+        DATABASE_URL=database_url,
     )
 
 
-@pytest.fixture(name="test_client")
-def test_client_fixture(test_db_engine, mock_settings):
-    """Create a FastAPI test client with mocked dependencies."""
+@pytest.fixture(name="test_client", scope="session")
+def test_client_fixture(mock_settings):
+    """Create a FastAPI test client with mocked dependencies.
+
+    The client is entered once per session so app startup and the underlying
+    httpx connection pool are shared by every test. It also serves WebSocket
+    routes, so HTTP and WS tests go through the same client.
+    """
+    engine = create_engine(
+        mock_settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+    )
+
     # Override get_engine to use test database
-    app.dependency_overrides[get_engine] = lambda: test_db_engine
+    app.dependency_overrides[get_engine] = lambda: engine
     
     # Override settings
     app.dependency_overrides[get_settings] = lambda: mock_settings
     
     # Create tables
-    SQLModel.metadata.create_all(test_db_engine)
+    SQLModel.metadata.create_all(engine)
     
-    with TestClient(app) as client:
+    # Store helpers use the module-level engine directly, so point it at the
+    # worker's database before startup seeds it
+    with patch("memory.store._engine", engine), TestClient(app) as client:
         yield client
     
     # Clean up
     app.dependency_overrides.clear()
-    SQLModel.metadata.drop_all(test_db_engine)
+    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
 
 
-@pytest.fixture
-def mock_gemini_api():
-    """Mock httpx client for Gemini API calls."""
-    import respx
-    from httpx import Response
-    
-    with respx.mock:
+@pytest.fixture(autouse=True)
+def _restore_dependency_overrides():
+    """Reset ``app.dependency_overrides`` to its pre-test state after every test.
+
+    Restores the session-wide overrides installed by test_client rather than
+    clearing them, so a test that overrides a dependency directly cannot leak it.
+    """
+    baseline = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(baseline)
+
+
+@pytest.fixture(name="override_dependency")
+def override_dependency_fixture():
+    """Temporarily override an app dependency inside a ``with`` block.
+
+    The previous override (e.g. the session-wide settings) is restored on exit,
+    even when an assertion fails.
+    """
+    @contextmanager
+    def override(dependency, provider):
+        previous = app.dependency_overrides.get(dependency)
+        app.dependency_overrides[dependency] = provider
+        try:
+            yield
+        finally:
+            if previous is None:
+                app.dependency_overrides.pop(dependency, None)
+            else:
+                app.dependency_overrides[dependency] = previous
+
+    return override
+
+
+@pytest.fixture(name="async_client")
+async def async_client_fixture(test_client):
+    """Async httpx client bound to the app for tests that issue concurrent requests.
+
+    Depends on test_client so app startup and dependency overrides are in place.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def mock_gemini_api(respx_router):
+    """Mock httpx client for Gemini API calls.
+
+    The Gemini route lives on the session router, so this only marks tests
+    that depend on it; nothing is patched per test.
+    """
+    return respx_router
+
+
+@pytest.fixture(name="seeded_templates", scope="session")
+def seeded_templates_fixture(test_client):
+    """Template list as seeded at app startup, fetched once per session.
+
+    Only for tests that read templates; tests that create or delete templates
+    must list them again themselves.
+    """
+    response = test_client.get("/templates")
+    assert response.status_code == 200
+    return response.json()["templates"]
+
+
+@pytest.fixture(name="flow_id")
+def flow_id_fixture(test_client):
+    """Create a fresh, empty flow and return its id."""
+    response = test_client.post("/flows", json={"name": "Test Flow"})
+    return response.json()["flowId"]
+
+
+@pytest.fixture(name="db_seeded_agent", scope="session")
+def db_seeded_agent_fixture(test_client):
+    """Insert an agent straight into the store once per session and return its id.
+
+    Skips the HTTP create path (and its Gemini call); tests that exercise
+    POST /agents create their own. Tests must treat this agent as read-only.
+    """
+    card = {
+        "id": "agent_seed",
+        "name": "Seed Agent",
+        "persona": {"role": "test", "goals": [], "tone": "neutral"},
+        "tools": [],
+        "memory": {"summaries": [], "vectors": []},
+    }
+    store.upsert_agent(store.Agent.from_card(card))
+    return card["id"]
+
+
+@pytest.fixture(name="session_id")
+def session_id_fixture(test_client, db_seeded_agent):
+    """Create a session for the seeded agent and return its id.
+
+    Goes through the API so the session runtime is registered as well.
+    """
+    response = test_client.post("/sessions", json={"agentId": db_seeded_agent})
+    return response.json()["sessionId"]
+
+
+@pytest.fixture(name="connected_ws")
+def connected_ws_fixture(test_client, session_id):
+    """Open the session event socket and consume the session.started handshake.
+
+    Yields ``(websocket, started_event)``.
+    """
+    with test_client.websocket_connect(f"/sessions/{session_id}/events") as ws:
+        started = ws.receive_json()
+        assert started["type"] == "session.started"
+        yield ws, started
+
+
+# External endpoints mocked by the session router
+_DAILY_ROOM_RE = re.compile(r"https://api\.daily\.co/v1/rooms/flowone-[^/]+$")
+_DAILY_ROOMS_URL = "https://api.daily.co/v1/rooms"
+_DAILY_TOKEN_URL = "https://api.daily.co/v1/meeting-tokens"
+_GEMINI_RE = re.compile(r"https://generativelanguage\.googleapis\.com/.*")
+
+
+def _daily_room_not_found(request):
+    """Daily's 404 for a room lookup, naming the room taken from the request path."""
+    room_name = request.url.path.rsplit("/", 1)[-1]
+    return Response(404, json={"error": "not-found", "info": f"room {room_name} not found"})
+
+
+@pytest.fixture(name="respx_router", scope="session", autouse=True)
+def respx_router_fixture():
+    """Install respx once per session with default Daily.co and Gemini routes.
+
+    Requests that match no route raise instead of reaching the network.
+    """
+    with respx.mock(assert_all_called=False) as router:
+        # Mock Daily room lookup for every flowone-* room with a single route
+        # (room not found, so callers create it)
+        router.get(_DAILY_ROOM_RE, name="daily_room_get").mock(side_effect=_daily_room_not_found)
+        
+        # Mock Daily room creation
+        router.post(_DAILY_ROOMS_URL, name="daily_room_post").respond(
+            200, json={"name": "test-room", "url": "https://test.daily.co/test-room"}
+        )
+        
+        # Mock Daily token creation
+        router.post(_DAILY_TOKEN_URL, name="daily_token_post").respond(
+            200, json={"token": "test-token"}
+        )
+        
         # Mock Gemini Flash endpoint
-        respx.post(
-            url__regex=r"https://generativelanguage\.googleapis\.com/.*"
-        ).mock(return_value=Response(200, json={
+        router.post(_GEMINI_RE).respond(200, json={
             "candidates": [{
                 "content": {
                     "parts": [{
@@ -83,25 +282,41 @@ def mock_gemini_api():
                     }]
                 }
             }]
-        }))
-        yield respx
+        })
+        yield router
 
 
 @pytest.fixture
-def mock_daily_api():
-    """Mock httpx client for Daily.co API calls."""
-    import respx
-    from httpx import Response
-    
-    with respx.mock:
-        # Mock Daily room creation
-        respx.post("https://api.daily.co/v1/rooms").mock(
-            return_value=Response(200, json={"name": "test-room", "url": "https://test.daily.co/test-room"})
-        )
-        
-        # Mock Daily token creation
-        respx.post("https://api.daily.co/v1/meeting-tokens").mock(
-            return_value=Response(200, json={"token": "test-token"})
-        )
-        yield respx
+def http_mock(respx_router):
+    """Session respx router for per-test routes and overrides.
+
+    Routes the test adds or changes are rolled back afterwards.
+    """
+    respx_router.snapshot()
+    yield respx_router
+    respx_router.rollback()
+
+
+@pytest.fixture
+def mock_daily_api(http_mock):
+    """Mock httpx client for Daily.co API calls.
 
+    The Daily routes live on the session router; ``http_mock`` rolls back
+    any the test overrides.
+    """
+    return http_mock
+
+
+@pytest.fixture
+def daily_routes(mock_daily_api):
+    """Named Daily.co routes on the session router for per-test responses.
+
+    ``get`` is the room lookup, ``post`` room creation and ``token`` the
+    meeting-token call; e.g. ``daily_routes.token.respond(400)``. Changes are
+    rolled back by ``http_mock``.
+    """
+    return SimpleNamespace(
+        get=mock_daily_api["daily_room_get"],
+        post=mock_daily_api["daily_room_post"],
+        token=mock_daily_api["daily_token_post"],
+    )
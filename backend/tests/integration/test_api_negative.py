@@ -0,0 +1,28 @@
+"""Integration tests for status-code-only error paths across the API."""
+import pytest
+
+
+pytestmark = pytest.mark.integration
+
+
+class TestNegativePaths:
+    """Unknown ids and missing parameters return the right error status."""
+
+    @pytest.mark.parametrize(
+        "method,url,body,expected",
+        [
+            pytest.param("GET", "/flows/nonexistent", None, 404, id="get-flow"),
+            pytest.param("GET", "/agents/nonexistent", None, 404, id="get-agent"),
+            pytest.param("PATCH", "/agents/nonexistent", {"tone": "friendly"}, 404, id="patch-agent"),
+            pytest.param("POST", "/sessions", {"agentId": "nonexistent"}, 404, id="session-for-agent"),
+            pytest.param("PUT", "/templates/nonexistent", {"key": "test", "name": "Test"}, 404, id="update-template"),
+            pytest.param("DELETE", "/templates/nonexistent", None, 404, id="delete-template"),
+            # Missing required query parameter
+            pytest.param("GET", "/voice/tokens", None, 422, id="voice-tokens-no-session"),
+        ],
+    )
+    def test_negative_paths(self, test_client, method, url, body, expected):
+        """Test the endpoint rejects the request with the expected status."""
+        response = test_client.request(method, url, json=body)
+
+        assert response.status_code == expected
@@ -1,6 +1,11 @@
 """Integration tests for templates API."""
 import pytest
 
+from .helpers import by_key
+
+
+pytestmark = pytest.mark.integration
+
 
 class TestTemplatesAPI:
     """Test suite for /templates endpoints."""
@@ -37,7 +42,7 @@ class TestTemplatesAPI:
         # Verify template was created
         list_response = test_client.get("/templates")
         templates = list_response.json()["templates"]
-        custom = next((t for t in templates if t["key"] == "custom_template"), None)
+        custom = by_key(templates).get("custom_template")
         assert custom is not None
         assert custom["name"] == "Custom Template"
 
@@ -73,22 +78,10 @@ class TestTemplatesAPI:
         # Verify update
         list_response = test_client.get("/templates")
         templates = list_response.json()["templates"]
-        updated = next((t for t in templates if t["id"] == template_id), None)
+        updated = by_key(templates, "id").get(template_id)
         assert updated is not None
         assert updated["name"] == "Updated Template"
 
-    def test_update_nonexistent_template(self, test_client):
-        """Test PUT /templates/:id for non-existent template."""
-        response = test_client.put(
-            "/templates/nonexistent",
-            json={
-                "key": "test",
-                "name": "Test"
-            }
-        )
-        
-        assert response.status_code == 404
-
     def test_delete_template(self, test_client):
         """Test DELETE /templates/:id endpoint."""
         # Create a template
@@ -113,26 +106,13 @@ class TestTemplatesAPI:
         # Verify deletion
         list_response = test_client.get("/templates")
         templates = list_response.json()["templates"]
-        deleted = next((t for t in templates if t["id"] == template_id), None)
-        assert deleted is None
-
-    def test_delete_nonexistent_template(self, test_client):
-        """Test DELETE /templates/:id for non-existent template."""
-        response = test_client.delete("/templates/nonexistent")
-        
-        assert response.status_code == 404
+        assert template_id not in by_key(templates, "id")
 
-    def test_default_templates_seeded(self, test_client):
+    def test_default_templates_seeded(self, seeded_templates):
         """Test that default templates are seeded on startup."""
-        response = test_client.get("/templates")
-        
-        assert response.status_code == 200
-        templates = response.json()["templates"]
-        
         # Check for expected default templates
-        template_keys = [t["key"] for t in templates]
+        template_keys = [t["key"] for t in seeded_templates]
         assert "sales" in template_keys
         assert "tutor" in template_keys
         assert "support" in template_keys
         assert "coach" in template_keys
-
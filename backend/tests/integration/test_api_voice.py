@@ -1,5 +1,12 @@
 """Integration tests for voice API."""
+import httpx
 import pytest
+from httpx import Response
+
+from backend.settings import Settings, get_settings
+
+
+pytestmark = pytest.mark.integration
 
 
 class TestVoiceAPI:
@@ -16,13 +23,6 @@ class TestVoiceAPI:
         assert data["room"] == "flowone-test-session-123"
         assert len(data["token"]) > 0
 
-    def test_voice_tokens_requires_session_id(self, test_client):
-        """Test that GET /voice/tokens requires sessionId parameter."""
-        response = test_client.get("/voice/tokens")
-        
-        # Should return 422 for missing required query parameter
-        assert response.status_code == 422
-
     def test_voice_tokens_creates_daily_room(self, test_client, mock_daily_api):
         """Test that voice tokens endpoint creates Daily room."""
         response = test_client.get("/voice/tokens?sessionId=new-session")
@@ -32,11 +32,9 @@ class TestVoiceAPI:
         data = response.json()
         assert data["room"].startswith("flowone-")
 
-    def test_voice_tokens_without_daily_api_key(self, test_client):
+    def test_voice_tokens_without_daily_api_key(self, test_client, override_dependency):
         """Test voice tokens endpoint fails gracefully without Daily API key."""
         # Override settings to remove Daily API key
-        from backend.settings import Settings
-        
         def mock_settings_no_daily():
             return Settings(
                 GEMINI_API_KEY="test",
@@ -46,38 +44,61 @@ class TestVoiceAPI:
                 DATABASE_URL="sqlite:///:memory:"
             )
         
-        from backend.app import app
-        from backend.settings import get_settings
-        
-        app.dependency_overrides[get_settings] = mock_settings_no_daily
-        
-        response = test_client.get("/voice/tokens?sessionId=test")
+        with override_dependency(get_settings, mock_settings_no_daily):
+            response = test_client.get("/voice/tokens?sessionId=test")
         
         # Should return 500 when Daily API key is missing
         assert response.status_code == 500
         assert "DAILY_API_KEY missing" in response.json()["detail"]
-        
-        # Clean up override
-        app.dependency_overrides.pop(get_settings, None)
 
-    def test_voice_tokens_handles_daily_api_errors(self, test_client):
-        """Test voice tokens endpoint handles Daily API errors."""
-        import respx
-        from httpx import Response
+    @pytest.mark.parametrize(
+        "check_resp,create_resp,token_resp,expected_status",
+        [
+            pytest.param(Response(200, json={"name": "flowone-x"}), None, None, 200, id="room-already-exists"),
+            pytest.param(httpx.ConnectError("boom"), None, None, 200, id="room-check-error"),
+            pytest.param(
+                None,
+                Response(400, json={"error": "invalid-request-error", "info": "a room named flowone-x already exists"}),
+                None,
+                200,
+                id="duplicate-room",
+            ),
+            # Room creation failures are non-fatal; the token call decides the outcome
+            pytest.param(None, Response(500, json={"error": "Internal error"}), None, 200, id="room-creation-fails"),
+            pytest.param(
+                None,
+                Response(400, json={"error": "invalid-request-error", "info": "bad privacy"}),
+                None,
+                200,
+                id="room-creation-400-non-duplicate",
+            ),
+            pytest.param(None, Response(400, text="Bad request"), None, 200, id="room-creation-400-no-json"),
+            pytest.param(None, None, Response(400, json={"error": "Bad request"}), 500, id="token-creation-fails"),
+            pytest.param(
+                None,
+                Response(500, json={"error": "Internal error"}),
+                Response(400, json={"error": "Bad request"}),
+                500,
+                id="room-and-token-fail",
+            ),
+        ],
+    )
+    def test_voice_tokens_daily_api_scenarios(
+        self, test_client, daily_routes, check_resp, create_resp, token_resp, expected_status
+    ):
+        """Test voice tokens endpoint across Daily API responses and errors."""
+        for route, outcome in (
+            (daily_routes.get, check_resp),
+            (daily_routes.post, create_resp),
+            (daily_routes.token, token_resp),
+        ):
+            if isinstance(outcome, Exception):
+                route.mock(side_effect=outcome)
+            elif outcome is not None:
+                route.mock(return_value=outcome)
         
-        with respx.mock:
-            # Mock Daily API to return error
-            respx.post("https://api.daily.co/v1/rooms").mock(
-                return_value=Response(500, json={"error": "Internal error"})
-            )
-            respx.post("https://api.daily.co/v1/meeting-tokens").mock(
-                return_value=Response(400, json={"error": "Bad request"})
-            )
-            
-            response = test_client.get("/voice/tokens?sessionId=error-test")
-            
-            # Should handle errors gracefully
-            # Endpoint creates room first (may fail-open), then creates token
-            # If token creation fails, returns 500
-            assert response.status_code in [200, 500]
-
+        response = test_client.get("/voice/tokens?sessionId=x")
+        
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert response.json()["room"] == "flowone-x"
@@ -1,7 +1,9 @@
 """Unit tests for Gemini Flash service."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+import copy
 import json
+from dataclasses import dataclass
 
 from services.gemini_flash import (
     synthesize_agent_card,
@@ -11,6 +13,83 @@ from services.gemini_flash import (
 )
 
 
+# Shape of a Gemini generateContent response; only the first part's text varies
+_TEMPLATE = {"candidates": [{"content": {"parts": [{"text": None}]}}]}
+
+
+@dataclass
+class _FakeResp:
+    """Minimal stand-in for the httpx.Response the Gemini helpers read."""
+
+    payload: dict
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        return None
+
+
+# Model outputs, serialized once at import
+_AGENT_CARD_TEXT = json.dumps({
+    "id": "agent_test",
+    "name": "Test Agent",
+    "persona": {
+        "role": "You are a test agent",
+        "goals": ["test"],
+        "tone": "neutral",
+        "style": {}
+    },
+    "tools": [],
+    "memory": {"summaries": [], "vectors": []},
+    "routing": {}
+})
+_NLP_COMMAND_TEXT = json.dumps({
+    "action": "create",
+    "config": {"name": "Sales Agent"},
+    "details": ["parsed"]
+})
+
+# Read-only agent card for reply generation
+_REPLY_AGENT_CARD = {
+    "persona": {
+        "role": "You are helpful",
+        "tone": "friendly",
+        "style": {"max_words": 60}
+    }
+}
+
+
+def gemini_response(text):
+    """Build a mocked Gemini HTTP response whose first candidate part is ``text``."""
+    payload = copy.deepcopy(_TEMPLATE)
+    payload["candidates"][0]["content"]["parts"][0]["text"] = text
+    return _FakeResp(payload)
+
+
+@pytest.fixture
+def mock_gemini_post():
+    """Patch the Gemini httpx client and yield its ``post`` mock."""
+    with patch("services.gemini_flash.httpx.Client") as mock_client:
+        yield mock_client.return_value.__enter__.return_value.post
+
+
+@pytest.fixture
+def gemini_key():
+    """Patch settings with a Gemini API key configured."""
+    with patch("services.gemini_flash.get_settings") as mock_settings:
+        mock_settings.return_value.GEMINI_API_KEY = "test_key"
+        yield mock_settings
+
+
+@pytest.fixture
+def no_gemini_key():
+    """Patch settings with no Gemini API key, forcing the fallbacks."""
+    with patch("services.gemini_flash.get_settings") as mock_settings:
+        mock_settings.return_value.GEMINI_API_KEY = ""
+        yield mock_settings
+
+
 class TestGeminiFlash:
     """Test suite for Gemini Flash functions."""
 
@@ -26,144 +105,65 @@ class TestGeminiFlash:
         assert "tools" in card
         assert "memory" in card
 
-    @patch("services.gemini_flash.httpx.Client")
-    def test_synthesize_agent_card_success(self, mock_client):
+    def test_synthesize_agent_card_success(self, mock_gemini_post, gemini_key):
         """Test successful agent card synthesis."""
         # Mock successful API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "candidates": [{
-                "content": {
-                    "parts": [{
-                        "text": json.dumps({
-                            "id": "agent_test",
-                            "name": "Test Agent",
-                            "persona": {
-                                "role": "You are a test agent",
-                                "goals": ["test"],
-                                "tone": "neutral",
-                                "style": {}
-                            },
-                            "tools": [],
-                            "memory": {"summaries": [], "vectors": []},
-                            "routing": {}
-                        })
-                    }]
-                }
-            }]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = "test_key"
-            
-            card = synthesize_agent_card("Test", "test role", ["goal"], "friendly")
-            
-            assert card["name"] == "Test Agent"
-            assert "persona" in card
-
-    @patch("services.gemini_flash.httpx.Client")
-    def test_synthesize_agent_card_fallback_on_error(self, mock_client):
+        mock_gemini_post.return_value = gemini_response(_AGENT_CARD_TEXT)
+
+        card = synthesize_agent_card("Test", "test role", ["goal"], "friendly")
+        
+        assert card["name"] == "Test Agent"
+        assert "persona" in card
+
+    def test_synthesize_agent_card_fallback_on_error(self, mock_gemini_post, gemini_key):
         """Test fallback when API fails."""
         # Mock API error
-        mock_client.return_value.__enter__.return_value.post.side_effect = Exception("API Error")
-
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = "test_key"
-            
-            card = synthesize_agent_card("Test", "role", ["goal"], "neutral")
-            
-            # Should return fallback
-            assert "id" in card
-            assert card["name"] == "Test"
-
-    def test_synthesize_agent_card_no_api_key(self):
-        """Test fallback when no API key is set."""
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = ""
-            
-            card = synthesize_agent_card("Test", "role", ["goal"], "neutral")
-            
-            # Should use fallback
-            assert card["name"] == "Test"
-
-    @patch("services.gemini_flash.httpx.Client")
-    def test_parse_nlp_command_success(self, mock_client):
+        mock_gemini_post.side_effect = Exception("API Error")
+
+        card = synthesize_agent_card("Test", "role", ["goal"], "neutral")
+        
+        # Should return fallback
+        assert "id" in card
+        assert card["name"] == "Test"
+
+    def test_parse_nlp_command_success(self, mock_gemini_post, gemini_key):
         """Test successful NLP command parsing."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "candidates": [{
-                "content": {
-                    "parts": [{
-                        "text": json.dumps({
-                            "action": "create",
-                            "config": {"name": "Sales Agent"},
-                            "details": ["parsed"]
-                        })
-                    }]
-                }
-            }]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = "test_key"
-            
-            result = parse_nlp_command("Create a sales agent")
-            
-            assert result["action"] == "create"
-            assert "config" in result
-
-    def test_parse_nlp_command_no_api_key(self):
-        """Test NLP parsing fallback without API key."""
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = ""
-            
-            result = parse_nlp_command("test command")
-            
-            assert result["action"] == "unknown"
-            assert result["details"] == ["fallback"]
-
-    @patch("services.gemini_flash.httpx.Client")
-    def test_generate_agent_reply_success(self, mock_client):
+        mock_gemini_post.return_value = gemini_response(_NLP_COMMAND_TEXT)
+
+        result = parse_nlp_command("Create a sales agent")
+        
+        assert result["action"] == "create"
+        assert "config" in result
+
+    def test_generate_agent_reply_success(self, mock_gemini_post, gemini_key):
         """Test successful agent reply generation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "candidates": [{
-                "content": {
-                    "parts": [{
-                        "text": "This is a test reply from the agent."
-                    }]
-                }
-            }]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = "test_key"
-            
-            agent_card = {
-                "persona": {
-                    "role": "You are helpful",
-                    "tone": "friendly",
-                    "style": {"max_words": 60}
-                }
-            }
-            
-            reply = generate_agent_reply("Hello", agent_card)
-            
-            assert isinstance(reply, str)
-            assert len(reply) > 0
-
-    def test_generate_agent_reply_fallback(self):
-        """Test reply generation fallback without API key."""
-        with patch("services.gemini_flash.get_settings") as mock_settings:
-            mock_settings.return_value.GEMINI_API_KEY = ""
-            
-            reply = generate_agent_reply("Hello", {})
-            
-            assert "I heard: Hello" in reply
+        mock_gemini_post.return_value = gemini_response("This is a test reply from the agent.")
 
+        reply = generate_agent_reply("Hello", _REPLY_AGENT_CARD)
+        
+        assert isinstance(reply, str)
+        assert len(reply) > 0
+
+    @pytest.mark.parametrize(
+        "fn,args,check",
+        [
+            pytest.param(
+                synthesize_agent_card, ("Test", "role", ["goal"], "neutral"),
+                lambda card: card["name"] == "Test",
+                id="synthesize-agent-card",
+            ),
+            pytest.param(
+                parse_nlp_command, ("test command",),
+                lambda result: result["action"] == "unknown" and result["details"] == ["fallback"],
+                id="parse-nlp-command",
+            ),
+            pytest.param(
+                generate_agent_reply, ("Hello", {}),
+                lambda reply: "I heard: Hello" in reply,
+                id="generate-agent-reply",
+            ),
+        ],
+    )
+    def test_fallback_without_api_key(self, no_gemini_key, fn, args, check):
+        """Test each Gemini helper falls back when no API key is set."""
+        assert check(fn(*args))
@@ -5,6 +5,13 @@ from unittest.mock import patch, MagicMock
 from observability.langfuse import trace_event
 
 
+@pytest.fixture
+def langfuse_client(request):
+    """Patch the module's Langfuse client with ``request.param`` (None means unconfigured)."""
+    with patch("observability.langfuse._lf", request.param):
+        yield request.param
+
+
 class TestLangfuse:
     """Test suite for Langfuse tracing."""
 
@@ -26,9 +33,7 @@ class TestLangfuse:
     @patch("observability.langfuse._lf")
     def test_trace_event_calls_langfuse_when_available(self, mock_lf):
         """Test that trace_event calls Langfuse client when configured."""
-        mock_lf.event = MagicMock()
-        
-        trace_id = trace_event("test.event", key="value")
+        trace_event("test.event", key="value")
         
         # Should have called langfuse event
         mock_lf.event.assert_called_once()
@@ -36,21 +41,17 @@ class TestLangfuse:
         assert call_args[1]["name"] == "test.event"
         assert "key" in call_args[1]["metadata"]
 
-    def test_trace_event_fail_open_on_error(self):
-        """Test that trace_event doesn't raise on Langfuse error."""
-        with patch("observability.langfuse._lf") as mock_lf:
-            mock_lf.event.side_effect = Exception("Langfuse error")
-            
-            # Should not raise
-            trace_id = trace_event("test.event")
-            
-            assert trace_id is not None
-
-    def test_trace_event_without_langfuse(self):
-        """Test trace_event when Langfuse is not configured."""
-        with patch("backend.observability.langfuse._lf", None):
-            trace_id = trace_event("test.event")
-            
-            # Should still return a trace_id
-            assert trace_id is not None
-
+    @pytest.mark.parametrize(
+        "langfuse_client",
+        [
+            pytest.param(MagicMock(), id="configured"),
+            pytest.param(MagicMock(event=MagicMock(side_effect=Exception("Langfuse error"))), id="client-error"),
+            pytest.param(None, id="not-configured"),
+        ],
+        indirect=True,
+    )
+    def test_trace_event_survives_all_client_states(self, langfuse_client):
+        """Test trace_event never raises and always returns a trace_id."""
+        trace_id = trace_event("test.event")
+        
+        assert trace_id is not None
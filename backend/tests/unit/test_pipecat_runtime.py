@@ -5,123 +5,107 @@ import asyncio
 from services.pipecat_runtime import Session, SessionManager
 
 
+# Read-only agent card shared by every test; copy it before mutating
+_AGENT_CARD = {"id": "test", "persona": {"role": "test"}}
+
+
+@pytest.fixture
+async def spawned():
+    """SessionManager with one spawned session.
+
+    Yields ``(manager, session_id, agent_card)`` and closes the session afterwards.
+    """
+    manager = SessionManager()
+    manager.spawn("test_session", _AGENT_CARD)
+    yield manager, "test_session", _AGENT_CARD
+    await manager.close_async("test_session")
+
+
 class TestPipecatRuntime:
     """Test suite for Pipecat runtime components."""
 
     @pytest.mark.asyncio
     async def test_session_creation(self):
         """Test session instantiation."""
-        agent_card = {"id": "test", "persona": {"role": "test"}}
-        session = Session("test_session", agent_card)
+        session = Session("test_session", _AGENT_CARD)
         
         assert session.id == "test_session"
-        assert session.agent == agent_card
+        assert session.agent == _AGENT_CARD
         assert session.queue is not None
 
-    @pytest.mark.asyncio
-    async def test_session_event_queue(self):
+    def test_session_event_queue(self):
         """Test session event queueing."""
-        agent_card = {"id": "test", "persona": {"role": "test"}}
-        session = Session("test_session", agent_card)
+        session = Session("test_session", _AGENT_CARD)
         
         # Add event to queue
         test_event = {"type": "test.event", "data": "test"}
-        await session.queue.put(test_event)
+        session.queue.put_nowait(test_event)
         
         # Retrieve event
-        event = await session.queue.get()
+        event = session.queue.get_nowait()
         assert event == test_event
 
     @pytest.mark.asyncio
     async def test_session_stream_events(self):
         """Test session event streaming."""
-        agent_card = {"id": "test", "persona": {"role": "test"}}
-        session = Session("test_session", agent_card)
+        session = Session("test_session", _AGENT_CARD)
         
         # Put some events
         await session.queue.put({"type": "event1"})
         await session.queue.put({"type": "event2"})
         
         # Stream events
-        events = []
-        async def collect_events():
-            count = 0
-            async for event in session.stream_events():
-                events.append(event)
-                count += 1
-                if count >= 2:
-                    break
-        
-        # Run with timeout
-        await asyncio.wait_for(collect_events(), timeout=1.0)
+        # Both events are already queued, so anything but an immediate read is a bug
+        stream = session.stream_events()
+        async with asyncio.timeout(0.05):
+            events = [await anext(stream) for _ in range(2)]
+        await stream.aclose()
         
         assert len(events) == 2
         assert events[0]["type"] == "event1"
         assert events[1]["type"] == "event2"
 
     @pytest.mark.asyncio
-    async def test_session_manager_spawn(self):
+    async def test_session_manager_spawn(self, spawned):
         """Test session manager spawning sessions."""
-        manager = SessionManager()
-        agent_card = {"id": "test", "persona": {"role": "test"}}
-        
-        manager.spawn("test_session", agent_card)
+        manager, session_id, _ = spawned
         
-        assert "test_session" in manager.sessions
-        assert manager.sessions["test_session"].id == "test_session"
+        assert session_id in manager.sessions
+        assert manager.sessions[session_id].id == session_id
 
     @pytest.mark.asyncio
-    async def test_session_manager_emit(self):
+    async def test_session_manager_emit(self, spawned):
         """Test session manager event emission."""
-        manager = SessionManager()
-        agent_card = {"id": "test", "persona": {"role": "test"}}
-        
-        manager.spawn("test_session", agent_card)
+        manager, session_id, _ = spawned
         
         # Emit event
         test_event = {"type": "test.emit", "data": "value"}
-        result = await manager.emit("test_session", test_event)
+        result = await manager.emit(session_id, test_event)
         
         assert result is True
         
         # Verify event in queue
-        session = manager.sessions["test_session"]
+        session = manager.sessions[session_id]
         # Queue should have session.started + test.emit
         assert session.queue.qsize() >= 1
 
-    @pytest.mark.asyncio
-    async def test_session_manager_events_stream(self):
-        """Test session manager event streaming."""
-        manager = SessionManager()
-        agent_card = {"id": "test", "persona": {"role": "test"}}
+    def test_session_manager_events_stream(self, spawned):
+        """Test session manager queues session.started on spawn."""
+        manager, session_id, _ = spawned
         
-        manager.spawn("test_session", agent_card)
+        # spawn() enqueues session.started synchronously, so it is already there
+        event = manager.sessions[session_id].queue.get_nowait()
         
-        events = []
-        async def collect_events():
-            count = 0
-            async for event in manager.events("test_session"):
-                events.append(event)
-                count += 1
-                if count >= 1:  # Get at least session.started
-                    break
-        
-        await asyncio.wait_for(collect_events(), timeout=2.0)
-        
-        assert len(events) >= 1
-        assert events[0]["type"] == "session.started"
+        assert event["type"] == "session.started"
 
     @pytest.mark.asyncio
-    async def test_session_manager_close(self):
+    async def test_session_manager_close(self, spawned):
         """Test session manager closing sessions."""
-        manager = SessionManager()
-        agent_card = {"id": "test", "persona": {"role": "test"}}
-        
-        manager.spawn("test_session", agent_card)
-        assert "test_session" in manager.sessions
+        manager, session_id, _ = spawned
+        assert session_id in manager.sessions
         
-        manager.close("test_session")
-        assert "test_session" not in manager.sessions
+        manager.close(session_id)
+        assert session_id not in manager.sessions
 
     @pytest.mark.asyncio
     async def test_session_manager_emit_to_nonexistent_session(self):
@@ -0,0 +1,146 @@
+"""Unit tests for Tavus Phoenix API client."""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from services.tavus_client import TavusClient, get_tavus_client
+
+
+BASE_URL = "https://tavusapi.com/v2"
+
+
+@pytest.fixture(scope="module")
+def tavus_client():
+    """Tavus client with an API key configured, shared by the module.
+
+    Tests that change its attributes must do so through ``monkeypatch``.
+    """
+    client = TavusClient()
+    client.base_url = BASE_URL
+    client.api_key = "test_key"
+    return client
+
+
+class TestTavusClient:
+    """Test suite for TavusClient."""
+
+    @pytest.mark.parametrize(
+        "method,kwargs,verb,path,status,payload,expected",
+        [
+            pytest.param(
+                "start_phoenix_session",
+                {"replica_id": "replica_1", "audio_stream_url": "wss://audio.example/in"},
+                "POST", "/phoenix", 201,
+                {"session_id": "session_1", "video_stream_url": "https://video.example/stream", "status": "started"},
+                {"error": None, "session_id": "session_1", "video_stream_url": "https://video.example/stream"},
+                id="start-phoenix-session",
+            ),
+            pytest.param(
+                "stop_phoenix_session",
+                {"session_id": "session_1"},
+                "POST", "/phoenix/session_1/stop", 204, None,
+                {"error": None, "status": "stopped"},
+                id="stop-phoenix-session",
+            ),
+            pytest.param(
+                "get_replicas",
+                {},
+                "GET", "/replicas", 200,
+                {"replicas": [{"replica_id": "replica_1", "name": "Test"}]},
+                {"error": None, "replicas": [{"replica_id": "replica_1", "name": "Test"}]},
+                id="get-replicas",
+            ),
+            pytest.param(
+                "create_replica",
+                {"name": "New", "video_url": "https://video.example/train.mp4"},
+                "POST", "/replicas", 201,
+                {"replica_id": "replica_2", "status": "training"},
+                {"error": None, "replica_id": "replica_2", "status": "training"},
+                id="create-replica",
+            ),
+        ],
+    )
+    async def test_success(self, tavus_client, http_mock, method, kwargs, verb, path, status, payload, expected):
+        """Test each API call against a successful Tavus response."""
+        route = http_mock.route(method=verb, url=f"{BASE_URL}{path}").respond(status, json=payload)
+
+        result = await getattr(tavus_client, method)(**kwargs)
+
+        for key, value in expected.items():
+            assert result[key] == value
+        assert route.calls.last.request.headers["x-api-key"] == "test_key"
+
+    async def test_start_phoenix_session_api_error(self, tavus_client, http_mock):
+        """Test Phoenix session start with an API error response."""
+        http_mock.post(f"{BASE_URL}/phoenix").respond(500, text="boom")
+
+        result = await tavus_client.start_phoenix_session("replica_1", "wss://audio.example/in")
+
+        assert result["error"] == "Tavus API error: 500"
+        assert result["session_id"] is None
+        assert result["details"] == "boom"
+
+    async def test_start_phoenix_session_timeout(self, tavus_client, http_mock):
+        """Test Phoenix session start when the API times out."""
+        http_mock.post(f"{BASE_URL}/phoenix").mock(side_effect=httpx.ReadTimeout("slow"))
+
+        result = await tavus_client.start_phoenix_session("replica_1", "wss://audio.example/in")
+
+        assert result["error"].startswith("Tavus API timeout")
+        assert result["session_id"] is None
+
+    @pytest.mark.parametrize(
+        "method,kwargs,field,expected",
+        [
+            pytest.param(
+                "start_phoenix_session",
+                {"replica_id": "replica_1", "audio_stream_url": "wss://audio.example/in"},
+                "session_id", None,
+                id="start-phoenix-session",
+            ),
+            pytest.param("stop_phoenix_session", {"session_id": "session_1"}, "status", "failed", id="stop-phoenix-session"),
+            pytest.param("get_replicas", {}, "replicas", [], id="get-replicas"),
+            pytest.param(
+                "create_replica",
+                {"name": "New", "video_url": "https://video.example/train.mp4"},
+                "replica_id", None,
+                id="create-replica",
+            ),
+        ],
+    )
+    async def test_no_api_key(self, tavus_client, monkeypatch, method, kwargs, field, expected):
+        """Test each API call short-circuits without an API key."""
+        monkeypatch.setattr(tavus_client, "api_key", "")
+
+        result = await getattr(tavus_client, method)(**kwargs)
+
+        assert result["error"] == "TAVUS_API_KEY not configured"
+        assert result[field] == expected
+
+    async def test_injected_transport(self):
+        """Test requests go through a transport passed to the constructor."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"replicas": []})
+
+        client = TavusClient(transport=httpx.MockTransport(handler))
+        client.api_key = "test_key"
+
+        result = await client.get_replicas()
+
+        assert result == {"error": None, "replicas": []}
+        assert requests[0].url.path.endswith("/replicas")
+
+    def test_get_tavus_client(self):
+        """Test the client factory normalizes the configured base URL."""
+        with patch("services.tavus_client.get_settings") as mock_settings:
+            mock_settings.return_value.TAVUS_BASE_URL = "https://tavus.example/v2/"
+            mock_settings.return_value.TAVUS_API_KEY = "test_key"
+            client = get_tavus_client()
+
+        assert isinstance(client, TavusClient)
+        assert client.base_url == "https://tavus.example/v2"
+        assert client.api_key == "test_key"